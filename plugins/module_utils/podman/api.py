@@ -0,0 +1,184 @@
+# Copyright (c) 2026 Red Hat
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import errno
+import json
+import os
+import socket
+import subprocess
+import time
+
+from ansible.module_utils.six.moves.http_client import BadStatusLine, HTTPConnection, HTTPException
+from ansible.module_utils.six.moves.urllib.parse import quote, urlencode
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import DEBUG_VERBOSITY
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import json_loads
+
+API_VERSION = 'v4.0.0'
+API_SERVICE_START_TIMEOUT = 10
+# Seconds without requests after which a service started by the client exits
+API_SERVICE_IDLE_TIMEOUT = 60
+
+
+def default_socket_path():
+    """Return the path of the Podman API socket for the current user."""
+    if os.geteuid() == 0:
+        return '/run/podman/podman.sock'
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/run/user/%d' % os.getuid()
+    return os.path.join(runtime_dir, 'podman', 'podman.sock')
+
+
+def parse_pull_report(body):
+    """Parse the stream of JSON objects returned by the libpod pull endpoint.
+
+    Returns a tuple of (image ids, error message).
+    """
+    image_ids, error = [], None
+    for line in body.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        report = json_loads(line)
+        if report.get('error'):
+            error = report['error']
+        if report.get('images'):
+            image_ids = report['images']
+        elif report.get('id') and not image_ids:
+            image_ids = [report['id']]
+    return image_ids, error
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """HTTP connection over a unix domain socket."""
+
+    def __init__(self, socket_path, timeout=None):
+        HTTPConnection.__init__(self, 'localhost')
+        self.socket_path = socket_path
+        self.socket_timeout = timeout
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.socket_timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class PodmanAPIClient(object):
+    """Minimal client for the libpod REST API.
+
+    A single connection to the API socket is kept open and reused for
+    all requests. If the socket does not exist, a Podman API service is
+    started for the current user. It exits on its own once idle.
+    """
+
+    def __init__(self, module, executable, socket_path=None):
+        self.module = module
+        self.executable = executable
+        self.socket_path = socket_path or default_socket_path()
+        self._conn = None
+
+    def service_running(self):
+        """Return whether a Podman API service accepts connections on the socket."""
+        if self._conn is not None:
+            return True
+        conn = UnixHTTPConnection(self.socket_path)
+        try:
+            conn.connect()
+        except socket.error as e:
+            if e.errno in (errno.ECONNREFUSED, errno.ENOENT):
+                return False
+            self.module.fail_json(msg='Failed to connect to Podman API at %s: %s' % (self.socket_path, e))
+        self._conn = conn
+        return True
+
+    def _start_service(self):
+        socket_dir = os.path.dirname(self.socket_path)
+        if not os.path.isdir(socket_dir):
+            os.makedirs(socket_dir)
+        with open(os.devnull, 'r+') as devnull:
+            subprocess.Popen(
+                [self.executable, 'system', 'service', '--time=%d' % API_SERVICE_IDLE_TIMEOUT,
+                 'unix://' + self.socket_path],
+                stdin=devnull, stdout=devnull, stderr=devnull,
+                close_fds=True, preexec_fn=os.setsid)
+        deadline = time.time() + API_SERVICE_START_TIMEOUT
+        while not os.path.exists(self.socket_path):
+            if time.time() > deadline:
+                self.module.fail_json(msg='Podman API socket %s did not appear after starting the service' % self.socket_path)
+            time.sleep(0.1)
+
+    def _connection(self):
+        if not self.service_running():
+            if os.path.exists(self.socket_path):
+                # Left behind by a service that did not exit cleanly
+                os.unlink(self.socket_path)
+            self._start_service()
+            self._conn = UnixHTTPConnection(self.socket_path)
+        return self._conn
+
+    def request(self, method, path, params=None, headers=None):
+        """Send a request to the libpod API and return (status, body)."""
+        url = '/{version}/libpod{path}'.format(version=API_VERSION, path=path)
+        if params:
+            url += '?' + urlencode(params)
+        if self.module._verbosity >= DEBUG_VERBOSITY:
+            self.module.log("PODMAN-API-DEBUG: %s %s" % (method, url))
+        for attempt in (1, 2):
+            conn = self._connection()
+            sent = False
+            try:
+                conn.request(method, url, headers=headers or {})
+                sent = True
+                response = conn.getresponse()
+                return response.status, response.read().decode('utf-8', errors='replace')
+            except (HTTPException, socket.error) as e:
+                conn.close()
+                self._conn = None
+                # Retrying is only safe if the server closed an idle keep-alive connection,
+                # which fails on send or before it returns a status line. Otherwise the
+                # request may have been processed already.
+                stale = not sent or isinstance(e, BadStatusLine)
+                if attempt == 2 or not stale:
+                    self.module.fail_json(msg='Failed to query Podman API at %s: %s' % (self.socket_path, e))
+
+    def inspect_image(self, name):
+        """Return image inspection data as a list like 'podman inspect', or None if not found."""
+        status, body = self.request('GET', '/images/{name}/json'.format(name=quote(name, safe='/:@')))
+        if status == 404:
+            return None
+        if status != 200:
+            self.module.fail_json(msg='Failed to inspect image {name}: {err}'.format(name=name, err=body))
+        return [json_loads(body)]
+
+    def image_exists(self, name):
+        """Return whether an image exists locally."""
+        status, body = self.request('GET', '/images/{name}/exists'.format(name=quote(name, safe='/:@')))
+        if status == 404:
+            return False
+        if status != 204:
+            self.module.fail_json(msg='Failed to check whether image {name} exists: {err}'.format(name=name, err=body))
+        return True
+
+    def pull_image(self, reference, arch=None, tls_verify=None, username=None, password=None):
+        """Pull an image and return (image ids, error message)."""
+        params = {'reference': reference, 'quiet': 'true'}
+        if arch:
+            params['arch'] = arch
+        if tls_verify is not None:
+            params['tlsVerify'] = 'true' if tls_verify else 'false'
+        headers = {}
+        if username and password:
+            auth = json.dumps({'username': username, 'password': password})
+            headers['X-Registry-Auth'] = base64.urlsafe_b64encode(auth.encode('utf-8')).decode('ascii')
+        status, body = self.request('POST', '/images/pull', params=params, headers=headers)
+        if status != 200:
+            return [], body
+        return parse_pull_report(body)
+
+    def remove_image(self, name, force=False):
+        """Remove an image and return (status, body)."""
+        params = {'force': 'true'} if force else None
+        return self.request('DELETE', '/images/{name}'.format(name=quote(name, safe='/:@')), params=params)
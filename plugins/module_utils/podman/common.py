@@ -7,6 +7,12 @@ __metaclass__ = type
 import json
 import os
 import shutil
+import subprocess
+import threading
+
+from collections import deque
+
+from ansible.module_utils._text import to_text
 
 from ansible.module_utils.six import raise_from
 try:
@@ -19,6 +25,15 @@ except ImportError:
                                ' < 2.11, you need to use Python < 3.12 with '
                                'distutils.version present'), exc)
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Verbosity from which podman commands and API requests are written to the module log
+DEBUG_VERBOSITY = 3
+
 ARGUMENTS_OPTS_DICT = {
     '--attach': ['--attach', '-a'],
     '--cpu-shares': ['--cpu-shares', '-c'],
@@ -52,6 +67,67 @@ def run_podman_command(module, executable='podman', args=None, expected_rc=0, ig
     return rc, out, err
 
 
+def run_podman_command_streaming(module, executable='podman', args=None, max_lines=500):
+    """Run podman and keep only the last max_lines lines of its stdout and stderr.
+
+    Both streams are read line by line, so memory usage does not grow with
+    the size of the output. Returns a tuple of (rc, out, err).
+    """
+    command = [executable]
+    if args is not None:
+        command.extend(args)
+    out_tail = deque(maxlen=max_lines)
+    err_tail = deque(maxlen=max_lines)
+    try:
+        with open(os.devnull, 'rb') as devnull:
+            proc = subprocess.Popen(command, stdin=devnull, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        module.fail_json(msg='Failed to run {command}: {err}'.format(command=command, err=to_text(e)))
+
+    def read(stream, tail):
+        for line in iter(stream.readline, b''):
+            tail.append(to_text(line, errors='surrogate_or_replace'))
+        stream.close()
+
+    # Stderr is drained in a thread so that neither pipe can fill up and block podman
+    err_reader = threading.Thread(target=read, args=(proc.stderr, err_tail))
+    err_reader.daemon = True
+    err_reader.start()
+    read(proc.stdout, out_tail)
+    err_reader.join()
+    rc = proc.wait()
+    return rc, ''.join(out_tail), ''.join(err_tail)
+
+
+def run_podman_commands_parallel(executable='podman', args_list=None, max_workers=4):
+    """Run several podman commands concurrently.
+
+    At most max_workers commands run at the same time, or one after another
+    on Python 2. Returns a list of (rc, out, err) tuples in the same order
+    as args_list.
+    """
+    def run(args):
+        try:
+            with open(os.devnull, 'rb') as devnull:
+                proc = subprocess.Popen([executable] + args, stdin=devnull,
+                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                out, err = proc.communicate()
+        except OSError as e:
+            return 1, '', to_text(e)
+        return (proc.returncode,
+                to_text(out, errors='surrogate_or_replace'),
+                to_text(err, errors='surrogate_or_replace'))
+
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:
+        # Python 2 has no concurrent.futures, run the commands one after another
+        return [run(args) for args in args_list or []]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, args_list or []))
+
+
 def run_generate_systemd_command(module, module_params, name, version):
     """Generate systemd unit file."""
     command = [module_params['executable'], 'generate', 'systemd',
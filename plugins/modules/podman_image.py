@@ -22,8 +22,12 @@ DOCUMENTATION = r'''
     name:
       description:
         - Name of the image to pull, push, or delete. It may contain a tag using the format C(image:tag).
+        - May also be a list of image names, which are all handled within a single module run.
+          When only pulling images, that is with I(state=present) and without building or pushing,
+          missing images are pulled together, see I(parallel_pulls). A list is not supported
+          with I(state=quadlet).
       required: True
-      type: str
+      type: raw
     executable:
       description:
         - Path to C(podman) executable if it is not in the C($PATH) on the machine running C(podman).
@@ -45,7 +49,15 @@ DOCUMENTATION = r'''
     pull_extra_args:
       description:
         - Extra arguments to pass to the pull command.
-      type: str
+        - Either a string, which is split like a shell command line, or a list of arguments.
+      type: raw
+    parallel_pulls:
+      description:
+        - Maximum number of images pulled concurrently when I(name) is a list of images.
+        - With C(1), the images are pulled by a single C(podman pull) command if podman supports it,
+          one after another otherwise.
+      type: int
+      default: 4
     push:
       description: Whether or not to push an image.
       default: False
@@ -136,7 +148,8 @@ DOCUMENTATION = r'''
         extra_args:
           description:
             - Extra args to pass to build, if executed. Does not idempotently check for new build args.
-          type: str
+            - Either a string, which is split like a shell command line, or a list of arguments.
+          type: raw
         target:
           description:
             - Specify the target build stage to build.
@@ -184,7 +197,24 @@ DOCUMENTATION = r'''
         extra_args:
           description:
             - Extra args to pass to push, if executed. Does not idempotently check for new push args.
-          type: str
+            - Either a string, which is split like a shell command line, or a list of arguments.
+          type: raw
+    connection:
+      description:
+        - Name of a podman system connection, as added with C(podman system connection add),
+          to run all podman commands against a remote podman service.
+        - Mutually exclusive with I(use_api).
+      type: str
+    use_api:
+      description:
+        - Use the Podman REST API over its unix socket instead of running the C(podman) command
+          for inspecting, pulling and removing images. Building and pushing always use the command.
+        - If no Podman API service listens on the socket, one is started for the current user.
+          A socket file left behind by a service that is gone is removed first.
+          It exits after being idle for 60 seconds. In check mode no service is started and the
+          C(podman) command is used instead.
+      type: bool
+      default: False
     quadlet_dir:
       description:
         - Path to the directory to write quadlet file in.
@@ -210,6 +240,12 @@ EXAMPLES = r"""
   containers.podman.podman_image:
     name: quay.io/bitnami/wildfly
 
+- name: Pull several images at once
+  containers.podman.podman_image:
+    name:
+      - quay.io/bitnami/wildfly
+      - docker.io/library/redis:7
+
 - name: Remove an image
   containers.podman.podman_image:
     name: quay.io/bitnami/wildfly
@@ -278,13 +314,12 @@ EXAMPLES = r"""
 
 - name: Build and push an image to multiple registries
   containers.podman.podman_image:
-    name: "{{ item }}"
+    name:
+      - quay.io/acme/nginx
+      - docker.io/acme/nginx
     path: /path/to/build/dir
     push: true
     auth_file: /etc/containers/auth.json
-    loop:
-    - quay.io/acme/nginx
-    - docker.io/acme/nginx
 
 - name: Build and push an image to multiple registries with separate parameters
   containers.podman.podman_image:
@@ -326,6 +361,7 @@ RETURN = r"""
   image:
     description:
       - Image inspection results for the image that was pulled, pushed, or built.
+      - When I(name) is a list, the results for all images are returned in one list.
     returned: success
     type: dict
     sample: [
@@ -445,15 +481,27 @@ RETURN = r"""
 
 import json
 import os
-import re
 import shlex
 
 from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.containers.podman.plugins.module_utils.podman.api import PodmanAPIClient
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import run_podman_command
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import run_podman_command_streaming
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import run_podman_commands_parallel
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import get_podman_version
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import json_loads
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import LooseVersion
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import DEBUG_VERBOSITY
 from ansible_collections.containers.podman.plugins.module_utils.podman.quadlet import create_quadlet_state
 
 
+# First podman release accepting several images in a single 'podman pull'
+MULTI_PULL_MIN_VERSION = '5.0.0'
+# Number of trailing lines of build output kept and returned in stdout
+BUILD_OUTPUT_MAX_LINES = 500
+
+
 class PodmanImageManager(object):
 
     def __init__(self, module, results):
@@ -462,11 +510,14 @@ class PodmanImageManager(object):
 
         self.module = module
         self.results = results
+        self._inspect_cache = {}
         self.name = self.module.params.get('name')
         self.executable = self.module.get_bin_path(module.params.get('executable'), required=True)
+        self._podman_version = None
         self.tag = self.module.params.get('tag')
         self.pull = self.module.params.get('pull')
         self.pull_extra_args = self.module.params.get('pull_extra_args')
+        self.parallel_pulls = self.module.params.get('parallel_pulls')
         self.push = self.module.params.get('push')
         self.path = self.module.params.get('path')
         self.force = self.module.params.get('force')
@@ -479,29 +530,103 @@ class PodmanImageManager(object):
         self.build = self.module.params.get('build')
         self.push_args = self.module.params.get('push_args')
         self.arch = self.module.params.get('arch')
+        self._pull_extra_args = split_extra_args(self.pull_extra_args)
+        self._build_extra_args = split_extra_args(self.build.get('extra_args'))
+        self._push_extra_args = split_extra_args(self.push_args.get('extra_args'))
+
+        # Options shared by pull, build and push only depend on the module parameters
+        self._arch_args = ['--arch', self.arch] if self.arch else []
+        self._auth_args = ['--authfile', self.auth_file] if self.auth_file else []
+        self._cred_args = []
+        if self.username and self.password:
+            self._cred_args = ['--creds', '{user}:{password}'.format(user=self.username, password=self.password)]
+        self._tls_args = []
+        if self.validate_certs is not None:
+            self._tls_args = ['--tls-verify'] if self.validate_certs else ['--tls-verify=false']
+        self._ca_args = ['--cert-dir', self.ca_cert_dir] if self.ca_cert_dir else []
+        self._pull_args = (self._arch_args + self._auth_args + self._cred_args
+                           + self._tls_args + self._ca_args + self._pull_extra_args)
+        connection = self.module.params.get('connection')
+        self._global_args = ['--connection', connection] if connection else []
+        self.api = None
+        if self.module.params.get('use_api'):
+            self.api = PodmanAPIClient(self.module, self.executable)
+            if self.module.check_mode and not self.api.service_running():
+                # Do not start an API service in check mode, look images up with the command instead
+                self.api = None
+
+        self.names = self.name if isinstance(self.name, list) else [self.name]
+        self.names = [to_native(name) for name in self.names]
+        if not self.names:
+            self.module.fail_json(msg='At least one image name is required')
+        if len(self.names) > 1:
+            if self.state == 'present' and not self.path and not self.push:
+                if self.parallel_pulls < 1:
+                    self.module.fail_json(msg='parallel_pulls must be at least 1')
+                self.image_names = [self._make_image_name(name)[1] for name in self.names]
+                self.present_many()
+            else:
+                self.run_many()
+            return
 
-        repo, repo_tag = parse_repository_tag(self.name)
-        if repo_tag:
-            self.name = repo
-            self.tag = repo_tag
-
-        delimiter = ':' if "sha256" not in self.tag else '@'
-        self.image_name = '{name}{d}{tag}'.format(name=self.name, d=delimiter, tag=self.tag)
+        self.name, self.image_name = self._make_image_name(self.names[0])
+        self.run_state()
 
+    def run_state(self):
         if self.state in ['present', 'build']:
             self.present()
 
         if self.state in ['absent']:
             self.absent()
 
-        if self.state == 'quadlet':
-            self.make_quadlet()
+    def run_many(self):
+        """Apply the state to each image of the list in turn within this module run."""
+        results = self.results
+        images, stdout = [], []
+        for name in self.names:
+            self.name, self.image_name = self._make_image_name(name)
+            # Actions are shared, everything else is collected per image
+            self.results = dict(results, changed=False, image={}, stdout='')
+            self.run_state()
+            results['changed'] = results['changed'] or self.results['changed']
+            if isinstance(self.results['image'], list):
+                images.extend(self.results['image'])
+            elif self.results['image']:
+                images.append(self.results['image'])
+            if self.results['stdout']:
+                stdout.append(self.results['stdout'])
+        self.results = results
+        self.results['image'] = images
+        self.results['stdout'] = "\n".join(stdout)
+
+    def _make_image_name(self, name):
+        tag = self.tag
+        repo, repo_tag = parse_repository_tag(name)
+        if repo_tag:
+            name = repo
+            tag = repo_tag
 
-    def _run(self, args, expected_rc=0, ignore_errors=False):
-        cmd = " ".join([self.executable]
-                       + [to_native(i) for i in args])
-        self.module.log("PODMAN-IMAGE-DEBUG: %s" % cmd)
+        delimiter = '@' if tag.startswith('sha256:') else ':'
+        return name, '{name}{d}{tag}'.format(name=name, d=delimiter, tag=tag)
+
+    @property
+    def podman_version(self):
+        if self._podman_version is None:
+            self._podman_version = get_podman_version(self.module, fail=False) or ''
+        return self._podman_version
+
+    def _supports_multi_pull(self):
+        return bool(self.podman_version) and LooseVersion(self.podman_version) >= LooseVersion(MULTI_PULL_MIN_VERSION)
+
+    def _log_command(self, args):
+        cmd = " ".join(map(to_native, [self.executable] + args))
+        if self.module._verbosity >= DEBUG_VERBOSITY:
+            self.module.log("PODMAN-IMAGE-DEBUG: %s" % cmd)
         self.results['podman_actions'].append(cmd)
+
+    def _run(self, args, expected_rc=0, ignore_errors=False):
+        args = self._global_args + args
+        self._log_command(args)
         return run_podman_command(
             module=self.module,
             executable=self.executable,
@@ -509,22 +634,38 @@ class PodmanImageManager(object):
             expected_rc=expected_rc,
             ignore_errors=ignore_errors)
 
-    def _get_id_from_output(self, lines, startswith=None, contains=None, split_on=' ', maxsplit=1):
-        layer_ids = []
-        for line in lines.splitlines():
-            if startswith and line.startswith(startswith) or contains and contains in line:
-                splitline = line.rsplit(split_on, maxsplit)
-                layer_ids.append(splitline[1])
+    def _run_streaming(self, args):
+        args = self._global_args + args
+        self._log_command(args)
+        return run_podman_command_streaming(
+            module=self.module,
+            executable=self.executable,
+            args=args,
+            max_lines=BUILD_OUTPUT_MAX_LINES)
+
+    def _get_id_from_output(self, lines, startswith='-->', split_on=' '):
+        # Only the last marker line matters, so search for it from the end
+        idx = lines.rfind('\n' + startswith)
+        if idx != -1:
+            idx += 1
+        elif lines.startswith(startswith):
+            idx = 0
+        if idx != -1:
+            end = lines.find('\n', idx)
+            line = lines[idx:] if end == -1 else lines[idx:end]
+            return line.rsplit(split_on, 1)[-1]
 
         # Podman 1.4 changed the output to only include the layer id when run in quiet mode
-        if not layer_ids:
-            layer_ids = lines.splitlines()
-
-        return (layer_ids[-1])
+        return lines.rstrip().rsplit('\n', 1)[-1]
 
     def present(self):
         image = self.find_image()
 
+        if image and not self.force and not self.push:
+            # Idempotent run, the lookup above is the only podman call needed
+            self.results['image'] = image
+            return
+
         if image:
             digest_before = image[0].get('Digest', image[0].get('digest'))
         else:
@@ -541,17 +682,19 @@ class PodmanImageManager(object):
                 self.results['actions'].append('Built image {image_name} from {path}'.format(
                     image_name=self.image_name, path=self.path))
                 if not self.module.check_mode:
-                    self.results['image'], self.results['stdout'] = self.build_image()
-                    image = self.results['image']
+                    image_id, self.results['stdout'] = self.build_image()
             else:
                 # Pull the image
                 self.results['actions'].append('Pulled image {image_name}'.format(image_name=self.image_name))
                 if not self.module.check_mode:
-                    image = self.results['image'] = self.pull_image()
+                    image_id = self.pull_image()
 
-            if not image:
-                image = self.find_image()
             if not self.module.check_mode:
+                image = self.find_image()
+                if not image and image_id:
+                    # The image does not match the requested architecture, report what was produced
+                    image = self.inspect_image(image_id)
+                self.results['image'] = image
                 digest_after = image[0].get('Digest', image[0].get('digest'))
                 self.results['changed'] = digest_before != digest_after
             else:
@@ -563,9 +706,30 @@ class PodmanImageManager(object):
         if image and not self.results.get('image'):
             self.results['image'] = image
 
+    def present_many(self):
+        images = dict((image_name, self.find_image(image_name)) for image_name in self.image_names)
+        to_pull = [image_name for image_name in self.image_names if self.force or not images[image_name]]
+        if not to_pull:
+            self.results['image'] = [i for image_name in self.image_names for i in images[image_name]]
+            return
+
+        for image_name in to_pull:
+            self.results['actions'].append('Pulled image {image_name}'.format(image_name=image_name))
+        if self.module.check_mode:
+            self.results['changed'] = True
+            return
+
+        self.pull_images(to_pull)
+        self.results['image'] = self.inspect_image(self.image_names)
+        for image_name, image in zip(self.image_names, self.results['image']):
+            digest_before = images[image_name][0].get('Digest', images[image_name][0].get('digest')) if images[image_name] else None
+            if digest_before != image.get('Digest', image.get('digest')):
+                self.results['changed'] = True
+
     def absent(self):
-        image = self.find_image()
-        image_id = self.find_image_id()
+        # Only the presence matters here, unless it depends on the architecture
+        image = self.find_image() if self.arch else self.image_exists()
+        image_id = None if image else self.find_image_id()
 
         if image:
             self.results['actions'].append('Removed image {name}'.format(name=self.name))
@@ -581,56 +745,84 @@ class PodmanImageManager(object):
             if not self.module.check_mode:
                 self.remove_image_id()
 
-    def make_quadlet(self):
-        results_update = create_quadlet_state(self.module, "image")
-        self.results.update(results_update)
-        self.module.exit_json(**self.results)
-
     def find_image(self, image_name=None):
         if image_name is None:
             image_name = self.image_name
-        args = ['image', 'ls', image_name, '--format', 'json']
-        rc, images, err = self._run(args, ignore_errors=True)
-        try:
-            images = json.loads(images)
-        except json.decoder.JSONDecodeError:
-            self.module.fail_json(msg='Failed to parse JSON output from podman image ls: {out}'.format(out=images))
-        if len(images) == 0:
-            # Let's find out if image exists
-            rc, out, err = self._run(['image', 'exists', image_name], ignore_errors=True)
-            if rc == 0:
-                inspect_json = self.inspect_image(image_name)
+        inspect_json = self._inspect_cache.get(image_name)
+        if inspect_json is None:
+            if self.api:
+                inspect_json = self.api.inspect_image(image_name)
             else:
+                args = ['image', 'inspect', image_name, '--format', 'json']
+                rc, image_data, err = self._run(args, ignore_errors=True)
+                if rc != 0:
+                    return None
+                try:
+                    inspect_json = json_loads(image_data)
+                except json.decoder.JSONDecodeError:
+                    self.module.fail_json(msg='Failed to parse JSON output from podman image inspect: {out}'.format(out=image_data))
+            if not inspect_json:
                 return None
-        if len(images) > 0:
-            inspect_json = self.inspect_image(image_name)
-        if self._is_target_arch(inspect_json, self.arch) or not self.arch:
-            return images or inspect_json
-        return None
+            self._inspect_cache[image_name] = inspect_json
+        if self.arch and inspect_json[0].get('Architecture') != self.arch:
+            return None
+        return inspect_json
 
-    def _is_target_arch(self, inspect_json=None, arch=None):
-        return arch and inspect_json[0]['Architecture'] == arch
+    def image_exists(self, image_name=None):
+        if image_name is None:
+            image_name = self.image_name
+        if image_name in self._inspect_cache:
+            return True
+        if self.api:
+            return self.api.image_exists(image_name)
+        rc, out, err = self._run(['image', 'exists', image_name], ignore_errors=True)
+        return rc == 0
 
     def find_image_id(self, image_id=None):
         if image_id is None:
             # If image id is set as image_name, remove tag
-            image_id = re.sub(':.*$', '', self.image_name)
+            image_id = self.image_name.partition(':')[0]
         args = ['image', 'ls', '--quiet', '--no-trunc']
         rc, candidates, err = self._run(args, ignore_errors=True)
-        candidates = [re.sub('^sha256:', '', c)
-                      for c in str.splitlines(candidates)]
-        for c in candidates:
-            if c.startswith(image_id):
-                return image_id
+        candidates = (c[7:] if c.startswith('sha256:') else c for c in candidates.splitlines())
+        if any(c.startswith(image_id) for c in candidates):
+            return image_id
         return None
 
     def inspect_image(self, image_name=None):
+        """Inspect one image or a list of images, reusing earlier results.
+
+        The cache is invalidated whenever an image is pulled, built or removed.
+        """
         if image_name is None:
             image_name = self.image_name
-        args = ['inspect', image_name, '--format', 'json']
+        if isinstance(image_name, list):
+            # Only images not inspected yet are passed to a single podman inspect
+            missing = [name for name in image_name if name not in self._inspect_cache]
+            if missing:
+                for name, data in zip(missing, self._do_inspect(missing) or []):
+                    self._inspect_cache[name] = [data]
+            return [data for name in image_name for data in self._inspect_cache.get(name, [])]
+        image_data = self._inspect_cache.get(image_name)
+        if image_data is None:
+            image_data = self._do_inspect([image_name])
+            if image_data:
+                self._inspect_cache[image_name] = image_data
+        return image_data
+
+    def _do_inspect(self, image_names):
+        if self.api:
+            image_data = []
+            for name in image_names:
+                inspect_json = self.api.inspect_image(name)
+                if not inspect_json:
+                    self.module.fail_json(msg='Failed to inspect image {name}: no such image'.format(name=name))
+                image_data.extend(inspect_json)
+            return image_data or None
+        args = ['inspect'] + image_names + ['--format', 'json']
         rc, image_data, err = self._run(args)
         try:
-            image_data = json.loads(image_data)
+            image_data = json_loads(image_data)
         except json.decoder.JSONDecodeError:
             self.module.fail_json(msg='Failed to parse JSON output from podman inspect: {out}'.format(out=image_data))
         if len(image_data) > 0:
@@ -638,60 +830,89 @@ class PodmanImageManager(object):
         else:
             return None
 
+    def _fail_pull(self, image_names):
+        image_name = ', '.join(image_names)
+        if not self.pull:
+            self.module.fail_json(msg='Failed to find image {image_name} locally, image pull set to {pull_bool}'.format(
+                pull_bool=self.pull, image_name=image_name))
+        else:
+            self.module.fail_json(msg='Failed to pull image {image_name}'.format(image_name=image_name))
+
+    def _api_pull(self, image_names):
+        image_ids = []
+        for image_name in image_names:
+            ids, err = self.api.pull_image(
+                image_name,
+                arch=self.arch,
+                tls_verify=self.validate_certs,
+                username=self.username,
+                password=self.password)
+            if err or not ids:
+                self._fail_pull([image_name])
+            image_ids.extend(ids)
+        return image_ids
+
+    def _pull(self, image_names):
+        for image_name in image_names:
+            self._inspect_cache.pop(image_name, None)
+
+        # The API has no equivalent for auth files, certificate directories and arbitrary extra arguments
+        if self.api and not (self.auth_file or self.ca_cert_dir or self._pull_extra_args):
+            return self._api_pull(image_names)
+
+        args = ['pull', '-q'] + image_names + self._pull_args
+        rc, out, err = self._run(args, ignore_errors=True)
+        if rc != 0:
+            self._fail_pull(image_names)
+        return out.strip().splitlines()
+
     def pull_image(self, image_name=None):
         if image_name is None:
             image_name = self.image_name
 
-        args = ['pull', image_name, '-q']
-
-        if self.arch:
-            args.extend(['--arch', self.arch])
-
-        if self.auth_file:
-            args.extend(['--authfile', self.auth_file])
-
-        if self.username and self.password:
-            cred_string = '{user}:{password}'.format(user=self.username, password=self.password)
-            args.extend(['--creds', cred_string])
-
-        if self.validate_certs is not None:
-            if self.validate_certs:
-                args.append('--tls-verify')
-            else:
-                args.append('--tls-verify=false')
-
-        if self.ca_cert_dir:
-            args.extend(['--cert-dir', self.ca_cert_dir])
+        image_ids = self._pull([image_name])
+        return image_ids[-1] if image_ids else None
 
-        if self.pull_extra_args:
-            args.extend(shlex.split(self.pull_extra_args))
+    def _pull_parallel(self, image_names):
+        args_list = []
+        for image_name in image_names:
+            self._inspect_cache.pop(image_name, None)
+            args = self._global_args + ['pull', '-q', image_name] + self._pull_args
+            self._log_command(args)
+            args_list.append(args)
 
-        rc, out, err = self._run(args, ignore_errors=True)
-        if rc != 0:
-            if not self.pull:
-                self.module.fail_json(msg='Failed to find image {image_name} locally, image pull set to {pull_bool}'.format(
-                    pull_bool=self.pull, image_name=image_name))
-            else:
-                self.module.fail_json(msg='Failed to pull image {image_name}'.format(image_name=image_name))
-        return self.inspect_image(out.strip())
+        image_ids = []
+        results = run_podman_commands_parallel(
+            executable=self.executable,
+            args_list=args_list,
+            max_workers=self.parallel_pulls)
+        failed = [image_name for image_name, (rc, out, err) in zip(image_names, results) if rc != 0]
+        if failed:
+            self._fail_pull(failed)
+        for rc, out, err in results:
+            image_ids.extend(out.strip().splitlines())
+        return image_ids
+
+    def pull_images(self, image_names):
+        """Pull several images, concurrently or in one podman invocation if podman supports it."""
+        if self.parallel_pulls > 1 and len(image_names) > 1 and not self.api:
+            return self._pull_parallel(image_names)
+        if self._supports_multi_pull():
+            return self._pull(image_names)
+        image_ids = []
+        for image_name in image_names:
+            image_ids.extend(self._pull([image_name]))
+        return image_ids
 
     def build_image(self):
-        args = ['build']
-        args.extend(['-t', self.image_name])
-
-        if self.validate_certs is not None:
-            if self.validate_certs:
-                args.append('--tls-verify')
-            else:
-                args.append('--tls-verify=false')
+        args = ['build', '-t', self.image_name] + self._tls_args
 
         annotation = self.build.get('annotation')
         if annotation:
             for k, v in annotation.items():
                 args.extend(['--annotation', '{k}={v}'.format(k=k, v=v)])
 
-        if self.ca_cert_dir:
-            args.extend(['--cert-dir', self.ca_cert_dir])
+        args.extend(self._ca_args)
 
         if self.build.get('force_rm'):
             args.append('--force-rm')
@@ -715,16 +936,9 @@ class PodmanImageManager(object):
             for v in volume:
                 args.extend(['--volume', v])
 
-        if self.auth_file:
-            args.extend(['--authfile', self.auth_file])
-
-        if self.username and self.password:
-            cred_string = '{user}:{password}'.format(user=self.username, password=self.password)
-            args.extend(['--creds', cred_string])
-
-        extra_args = self.build.get('extra_args')
-        if extra_args:
-            args.extend(shlex.split(extra_args))
+        args.extend(self._auth_args)
+        args.extend(self._cred_args)
+        args.extend(self._build_extra_args)
 
         target = self.build.get('target')
         if target:
@@ -732,31 +946,17 @@ class PodmanImageManager(object):
 
         args.append(self.path)
 
-        rc, out, err = self._run(args, ignore_errors=True)
+        self._inspect_cache.pop(self.image_name, None)
+        # Build logs can be huge, only the tail is kept for reporting and finding the image id
+        rc, out, err = self._run_streaming(args)
         if rc != 0:
             self.module.fail_json(msg="Failed to build image {image}: {out} {err}".format(image=self.image_name, out=out, err=err))
 
-        last_id = self._get_id_from_output(out, startswith='-->')
-        return self.inspect_image(last_id), out + err
+        last_id = self._get_id_from_output(out)
+        return last_id, out + err
 
     def push_image(self):
-        args = ['push']
-
-        if self.validate_certs is not None:
-            if self.validate_certs:
-                args.append('--tls-verify')
-            else:
-                args.append('--tls-verify=false')
-
-        if self.ca_cert_dir:
-            args.extend(['--cert-dir', self.ca_cert_dir])
-
-        if self.username and self.password:
-            cred_string = '{user}:{password}'.format(user=self.username, password=self.password)
-            args.extend(['--creds', cred_string])
-
-        if self.auth_file:
-            args.extend(['--authfile', self.auth_file])
+        args = ['push'] + self._tls_args + self._ca_args + self._cred_args + self._auth_args
 
         if self.push_args.get('compress'):
             args.append('--compress')
@@ -772,9 +972,7 @@ class PodmanImageManager(object):
         if sign_by_key:
             args.extend(['--sign-by', sign_by_key])
 
-        push_extra_args = self.push_args.get('extra_args')
-        if push_extra_args:
-            args.extend(shlex.split(push_extra_args))
+        args.extend(self._push_extra_args)
 
         args.append(self.image_name)
 
@@ -802,13 +1000,16 @@ class PodmanImageManager(object):
             self.module.fail_json(msg="Destination must be a full URL or path to a directory.")
 
         args.append(dest_string)
-        self.module.log("PODMAN-IMAGE-DEBUG: Pushing image {image_name} to {dest_string}".format(
-            image_name=self.image_name, dest_string=dest_string))
+        if self.module._verbosity >= DEBUG_VERBOSITY:
+            self.module.log("PODMAN-IMAGE-DEBUG: Pushing image {image_name} to {dest_string}".format(
+                image_name=self.image_name, dest_string=dest_string))
         self.results['actions'].append(" ".join(args))
-        self.results['podman_actions'].append(" ".join([self.executable] + args))
         self.results['changed'] = True
         out, err = '', ''
-        if not self.module.check_mode:
+        if self.module.check_mode:
+            # _run records the command otherwise
+            self._log_command(self._global_args + args)
+        else:
             rc, out, err = self._run(args, ignore_errors=True)
             if rc != 0:
                 self.module.fail_json(msg="Failed to push image {image_name}".format(
@@ -823,6 +1024,13 @@ class PodmanImageManager(object):
         if image_name is None:
             image_name = self.image_name
 
+        self._inspect_cache.pop(image_name, None)
+        if self.api:
+            status, out = self.api.remove_image(image_name, force=self.force)
+            if status != 200:
+                self.module.fail_json(msg='Failed to remove image {image_name}. {err}'.format(image_name=image_name, err=out))
+            return out
+
         args = ['rmi', image_name]
         if self.force:
             args.append('--force')
@@ -833,8 +1041,9 @@ class PodmanImageManager(object):
 
     def remove_image_id(self, image_id=None):
         if image_id is None:
-            image_id = re.sub(':.*$', '', self.image_name)
+            image_id = self.image_name.partition(':')[0]
 
+        self._inspect_cache.pop(image_id, None)
         args = ['rmi', image_id]
         if self.force:
             args.append('--force')
@@ -845,89 +1054,132 @@ class PodmanImageManager(object):
         return out
 
 
+def handle_quadlet(module, results):
+    """Write the quadlet file, which requires neither podman nor the image."""
+    if isinstance(module.params['name'], list):
+        module.fail_json(msg='A list of images is not supported for creating a quadlet file')
+    results.update(create_quadlet_state(module, "image"))
+
+
+def split_extra_args(extra_args):
+    """Return extra arguments given as a string or a list as a list."""
+    if not extra_args:
+        return []
+    if isinstance(extra_args, list):
+        return [to_native(arg) for arg in extra_args]
+    return shlex.split(to_native(extra_args))
+
+
 def parse_repository_tag(repo_name):
-    parts = repo_name.rsplit('@', 1)
-    if len(parts) == 2:
-        return tuple(parts)
+    if '@' in repo_name:
+        return tuple(repo_name.rsplit('@', 1))
     parts = repo_name.rsplit(':', 1)
     if len(parts) == 2 and '/' not in parts[1]:
         return tuple(parts)
     return repo_name, None
 
 
-def main():
-    module = AnsibleModule(
-        argument_spec=dict(
-            name=dict(type='str', required=True),
-            arch=dict(type='str'),
-            tag=dict(type='str', default='latest'),
-            pull=dict(type='bool', default=True),
-            pull_extra_args=dict(type='str'),
-            push=dict(type='bool', default=False),
-            path=dict(type='str'),
-            force=dict(type='bool', default=False),
-            state=dict(type='str', default='present', choices=['absent', 'present', 'build', 'quadlet']),
-            validate_certs=dict(type='bool', aliases=['tlsverify', 'tls_verify']),
-            executable=dict(type='str', default='podman'),
-            auth_file=dict(type='path', aliases=['authfile']),
-            username=dict(type='str'),
-            password=dict(type='str', no_log=True),
-            ca_cert_dir=dict(type='path'),
-            quadlet_dir=dict(type='path', required=False),
-            quadlet_filename=dict(type='str'),
-            quadlet_options=dict(type='list', elements='str', required=False),
-            build=dict(
-                type='dict',
-                aliases=['build_args', 'buildargs'],
-                default={},
-                options=dict(
-                    annotation=dict(type='dict'),
-                    force_rm=dict(type='bool', default=False),
-                    file=dict(type='path'),
-                    format=dict(
-                        type='str',
-                        choices=['oci', 'docker'],
-                        default='oci'
-                    ),
-                    cache=dict(type='bool', default=True),
-                    rm=dict(type='bool', default=True),
-                    volume=dict(type='list', elements='str'),
-                    extra_args=dict(type='str'),
-                    target=dict(type='str'),
-                ),
+_STATE_CHOICES = ('absent', 'present', 'build', 'quadlet')
+_BUILD_FORMAT_CHOICES = ('oci', 'docker')
+_PUSH_FORMAT_CHOICES = ('oci', 'v2s1', 'v2s2')
+_PUSH_TRANSPORT_CHOICES = (
+    'dir',
+    'docker-archive',
+    'docker-daemon',
+    'oci-archive',
+    'ostree',
+    'docker',
+)
+
+_TLS_ALIASES = ('tlsverify', 'tls_verify')
+_AUTHFILE_ALIASES = ('authfile',)
+_BUILD_ALIASES = ('build_args', 'buildargs')
+_DEST_ALIASES = ('destination',)
+
+_ARGUMENT_SPEC = dict(
+    name=dict(type='raw', required=True),
+    arch=dict(type='str'),
+    tag=dict(type='str', default='latest'),
+    pull=dict(type='bool', default=True),
+    pull_extra_args=dict(type='raw'),
+    parallel_pulls=dict(type='int', default=4),
+    push=dict(type='bool', default=False),
+    path=dict(type='str'),
+    force=dict(type='bool', default=False),
+    state=dict(type='str', default='present', choices=_STATE_CHOICES),
+    validate_certs=dict(type='bool', aliases=_TLS_ALIASES),
+    executable=dict(type='str', default='podman'),
+    use_api=dict(type='bool', default=False),
+    connection=dict(type='str'),
+    auth_file=dict(type='path', aliases=_AUTHFILE_ALIASES),
+    username=dict(type='str'),
+    password=dict(type='str', no_log=True),
+    ca_cert_dir=dict(type='path'),
+    quadlet_dir=dict(type='path', required=False),
+    quadlet_filename=dict(type='str'),
+    quadlet_options=dict(type='list', elements='str', required=False),
+    build=dict(
+        type='dict',
+        aliases=_BUILD_ALIASES,
+        default={},
+        options=dict(
+            annotation=dict(type='dict'),
+            force_rm=dict(type='bool', default=False),
+            file=dict(type='path'),
+            format=dict(
+                type='str',
+                choices=_BUILD_FORMAT_CHOICES,
+                default='oci'
             ),
-            push_args=dict(
-                type='dict',
-                default={},
-                options=dict(
-                    compress=dict(type='bool'),
-                    format=dict(type='str', choices=['oci', 'v2s1', 'v2s2']),
-                    remove_signatures=dict(type='bool'),
-                    sign_by=dict(type='str'),
-                    dest=dict(type='str', aliases=['destination'],),
-                    extra_args=dict(type='str'),
-                    transport=dict(
-                        type='str',
-                        choices=[
-                            'dir',
-                            'docker-archive',
-                            'docker-daemon',
-                            'oci-archive',
-                            'ostree',
-                            'docker'
-                        ]
-                    ),
-                ),
+            cache=dict(type='bool', default=True),
+            rm=dict(type='bool', default=True),
+            volume=dict(type='list', elements='str'),
+            extra_args=dict(type='raw'),
+            target=dict(type='str'),
+        ),
+    ),
+    push_args=dict(
+        type='dict',
+        default={},
+        options=dict(
+            compress=dict(type='bool'),
+            format=dict(type='str', choices=_PUSH_FORMAT_CHOICES),
+            remove_signatures=dict(type='bool'),
+            sign_by=dict(type='str'),
+            dest=dict(type='str', aliases=_DEST_ALIASES,),
+            extra_args=dict(type='raw'),
+            transport=dict(
+                type='str',
+                choices=_PUSH_TRANSPORT_CHOICES,
             ),
         ),
+    ),
+)
+
+_REQUIRED_TOGETHER = (
+    ['username', 'password'],
+)
+
+_MUTUALLY_EXCLUSIVE = (
+    ['auth_file', 'username'],
+    ['auth_file', 'password'],
+    ['use_api', 'connection'],
+)
+
+
+def main():
+    # AnsibleModule fills the defaults of the nested options into the default
+    # dicts, so build and push_args get fresh ones on every run
+    argument_spec = dict(
+        _ARGUMENT_SPEC,
+        build=dict(_ARGUMENT_SPEC['build'], default={}),
+        push_args=dict(_ARGUMENT_SPEC['push_args'], default={}),
+    )
+    module = AnsibleModule(
+        argument_spec=argument_spec,
         supports_check_mode=True,
-        required_together=(
-            ['username', 'password'],
-        ),
-        mutually_exclusive=(
-            ['auth_file', 'username'],
-            ['auth_file', 'password'],
-        ),
+        required_together=_REQUIRED_TOGETHER,
+        mutually_exclusive=_MUTUALLY_EXCLUSIVE,
     )
 
     results = dict(
@@ -938,7 +1190,10 @@ def main():
         stdout='',
     )
 
-    PodmanImageManager(module, results)
+    if module.params['state'] == 'quadlet':
+        handle_quadlet(module, results)
+    else:
+        PodmanImageManager(module, results)
     module.exit_json(**results)
 
 
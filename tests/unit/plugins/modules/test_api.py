@@ -0,0 +1,101 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import socket
+import threading
+
+import pytest
+
+from ansible_collections.containers.podman.plugins.module_utils.podman.api import (
+    PodmanAPIClient,
+    parse_pull_report,
+)
+
+
+@pytest.mark.parametrize('body, expected', [
+    ('', ([], None)),
+    ('{"id": "abc"}\n', (['abc'], None)),
+    ('{"stream": "Trying to pull..."}\n{"images": ["abc", "def"], "id": "abc"}\n',
+     (['abc', 'def'], None)),
+    ('{"stream": "Trying to pull..."}\n{"error": "manifest unknown"}\n',
+     ([], 'manifest unknown')),
+])
+def test_parse_pull_report(body, expected):
+    assert parse_pull_report(body) == expected
+
+
+@pytest.mark.parametrize('state, expected', [
+    ('missing', False),
+    ('stale', False),
+    ('listening', True),
+])
+def test_service_running(tmp_path, state, expected):
+    socket_path = str(tmp_path / 'podman.sock')
+    sock = None
+    if state != 'missing':
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(socket_path)
+        if state == 'listening':
+            sock.listen(1)
+        else:
+            # Closing the socket leaves the file behind, like a killed service
+            sock.close()
+    try:
+        assert PodmanAPIClient(None, 'podman', socket_path).service_running() is expected
+    finally:
+        if sock is not None:
+            sock.close()
+
+
+class FakeModule(object):
+    _verbosity = 0
+    check_mode = False
+
+    def fail_json(self, **kwargs):
+        raise RuntimeError(kwargs['msg'])
+
+
+def serve(socket_path, responses):
+    """Answer one request per connection with the next response, then close it."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(5)
+    received = []
+
+    def run():
+        for response in responses:
+            conn, _ = server.accept()
+            received.append(conn.recv(65536))
+            conn.sendall(response)
+            conn.close()
+        server.close()
+
+    thread = threading.Thread(target=run)
+    thread.daemon = True
+    thread.start()
+    return received
+
+
+def test_request_retries_closed_keepalive_connection(tmp_path):
+    socket_path = str(tmp_path / 'podman.sock')
+    received = serve(socket_path, [
+        b'HTTP/1.1 204 No Content\r\n\r\n',
+        b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n[]',
+    ])
+    client = PodmanAPIClient(FakeModule(), 'podman', socket_path)
+    assert client.request('GET', '/images/alpine/exists') == (204, '')
+    # The server closed the first connection after answering
+    assert client.request('POST', '/images/pull') == (200, '[]')
+    assert len(received) == 2
+
+
+def test_request_does_not_retry_interrupted_response(tmp_path):
+    socket_path = str(tmp_path / 'podman.sock')
+    received = serve(socket_path, [
+        b'HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\n{"id"',
+        b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}',
+    ])
+    client = PodmanAPIClient(FakeModule(), 'podman', socket_path)
+    with pytest.raises(RuntimeError, match='Failed to query Podman API'):
+        client.request('DELETE', '/images/alpine')
+    assert len(received) == 1
@@ -1,10 +1,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import sys
+
 import pytest
 
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import (
     lower_keys,
+    run_podman_command_streaming,
+    run_podman_commands_parallel,
 )
 
 
@@ -17,3 +21,30 @@ from ansible_collections.containers.podman.plugins.module_utils.podman.common im
 def test_lower_keys(test_input, expected):
     print(lower_keys.__code__.co_filename)
     assert lower_keys(test_input) == expected
+
+
+@pytest.mark.parametrize('code, max_lines, expected', [
+    ("print('one')", 5, (0, "one\n", "")),
+    ("import sys\nfor i in range(1000): print(i)\nsys.stderr.write('warning\\n')", 2, (0, "998\n999\n", "warning\n")),
+    ("import sys\nfor i in range(100000): sys.stderr.write('%d\\n' % i)\nprint('id')", 1, (0, "id\n", "99999\n")),
+    ("import sys\nprint('failed')\nsys.exit(3)", 5, (3, "failed\n", "")),
+])
+def test_run_podman_command_streaming(code, max_lines, expected):
+    assert run_podman_command_streaming(
+        None, executable=sys.executable, args=['-c', code], max_lines=max_lines) == expected
+
+
+@pytest.mark.parametrize('has_futures', [True, False])
+def test_run_podman_commands_parallel(monkeypatch, has_futures):
+    if not has_futures:
+        monkeypatch.setitem(sys.modules, 'concurrent.futures', None)
+    args_list = [
+        ['-c', "print('first')"],
+        ['-c', "import sys; sys.stderr.write('second'); sys.exit(2)"],
+        ['-c', "print('third')"],
+    ]
+    assert run_podman_commands_parallel(executable=sys.executable, args_list=args_list, max_workers=2) == [
+        (0, 'first\n', ''),
+        (2, '', 'second'),
+        (0, 'third\n', ''),
+    ]